@@ -17,59 +17,52 @@ from typing import Tuple
 TEMP_UNITS = ["C", "F", "K"]
 LEN_UNITS = ["cm", "in"]
 
+_UNIT_ALIASES = {
+    "c": "c",
+    "celsius": "c",
+    "centigrade": "c",
+    "f": "f",
+    "fahrenheit": "f",
+    "k": "k",
+    "kelvin": "k",
+    "cm": "cm",
+    "centimeter": "cm",
+    "centimeters": "cm",
+    "in": "in",
+    "inch": "in",
+    "inches": "in",
+}
+
+_TASK_ALIASES = {
+    "temperature": "t",
+    "temp": "t",
+    "t": "t",
+    "length": "l",
+    "len": "l",
+    "l": "l",
+}
+
+
 def _normalize_unit(unit: str) -> str:
-    u = unit.strip().lower()
-    if u in ("c", "celsius", "centigrade"):
-        return "c"
-    if u in ("f", "fahrenheit"):
-        return "f"
-    if u in ("k", "kelvin"):
-        return "k"
-    if u in ("cm", "centimeter", "centimeters"):
-        return "cm"
-    if u in ("in", "inch", "inches"):
-        return "in"
-    raise ValueError(f"Unknown unit: {unit}")
-
-
-def _to_celsius(value: float, unit: str) -> float:
-    u = _normalize_unit(unit)
-    if u == "c":
-        return value
-    if u == "f":
-        return (value - 32.0) * 5.0 / 9.0
-    if u == "k":
-        return value - 273.15
-    raise ValueError(f"Cannot convert {unit} to celsius")
-
-
-def _from_celsius(c: float, unit: str) -> float:
-    u = _normalize_unit(unit)
-    if u == "c":
-        return c
-    if u == "f":
-        return c * 9.0 / 5.0 + 32.0
-    if u == "k":
-        return c + 273.15
-    raise ValueError(f"Cannot convert celsius to {unit}")
-
-
-def _to_cm(value: float, unit: str) -> float:
-    u = _normalize_unit(unit)
-    if u == "cm":
-        return value
-    if u == "in":
-        return value * 2.54
-    raise ValueError(f"Cannot convert {unit} to cm")
-
-
-def _from_cm(cm: float, unit: str) -> float:
-    u = _normalize_unit(unit)
-    if u == "cm":
-        return cm
-    if u == "in":
-        return cm / 2.54
-    raise ValueError(f"Cannot convert cm to {unit}")
+    u = _UNIT_ALIASES.get(unit.strip().lower())
+    if u is None:
+        raise ValueError(f"Unknown unit: {unit}")
+    return u
+
+
+# (task, from_unit, to_unit) -> conversion, built once from the normalized tokens
+_CONVERTERS = {
+    ("t", "c", "f"): lambda v: v * 9.0 / 5.0 + 32.0,
+    ("t", "c", "k"): lambda v: v + 273.15,
+    ("t", "f", "c"): lambda v: (v - 32.0) * 5.0 / 9.0,
+    ("t", "f", "k"): lambda v: (v - 32.0) * 5.0 / 9.0 + 273.15,
+    ("t", "k", "c"): lambda v: v - 273.15,
+    ("t", "k", "f"): lambda v: (v - 273.15) * 9.0 / 5.0 + 32.0,
+    ("l", "cm", "in"): lambda v: v / 2.54,
+    ("l", "in", "cm"): lambda v: v * 2.54,
+}
+
+_TASK_UNITS = {"t": ("c", "f", "k"), "l": ("cm", "in")}
 
 
 def convert(task: str, value: float, from_unit: str, to_unit: str) -> float:
@@ -78,15 +71,17 @@ def convert(task: str, value: float, from_unit: str, to_unit: str) -> float:
     task: 'temperature' or 'length' (case-insensitive, accepts 'temp', 't', 'len')
     Raises ValueError on unknown units or tasks.
     """
-    t = task.strip().lower()
-    if t in ("temperature", "temp", "t"):
-        # use Celsius as intermediate
-        c = _to_celsius(value, from_unit)
-        return _from_celsius(c, to_unit)
-    if t in ("length", "len", "l"):
-        cm = _to_cm(value, from_unit)
-        return _from_cm(cm, to_unit)
-    raise ValueError(f"Unknown task: {task}")
+    t = _TASK_ALIASES.get(task.strip().lower())
+    if t is None:
+        raise ValueError(f"Unknown task: {task}")
+    from_u = _normalize_unit(from_unit)
+    to_u = _normalize_unit(to_unit)
+    if from_u == to_u and from_u in _TASK_UNITS[t]:
+        return float(value)
+    converter = _CONVERTERS.get((t, from_u, to_u))
+    if converter is None:
+        raise ValueError(f"Cannot convert {from_unit} to {to_unit}")
+    return converter(value)
 
 
 def parse_line(line: str) -> Tuple[str, float, str, str]:
@@ -95,10 +90,14 @@ def parse_line(line: str) -> Tuple[str, float, str, str]:
     Returns (task, value, input_unit, output_unit)
     Raises ValueError on malformed lines.
     """
-    parts = [p.strip() for p in line.strip().split(",")]
+    parts = line.strip().split(",", 3)
     if len(parts) < 4:
         raise ValueError("Each line must have 4 comma-separated fields: task,input_value,input_unit,output_unit")
-    task, raw_val, in_unit, out_unit = parts[:4]
+    task, raw_val, in_unit, rest = parts
+    task = task.strip()
+    raw_val = raw_val.strip()
+    in_unit = in_unit.strip()
+    out_unit = rest.split(",", 1)[0].strip()
     try:
         val = float(raw_val)
     except Exception:
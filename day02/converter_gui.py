@@ -36,25 +36,20 @@ class ConverterGUI(tk.Tk):
             state="readonly",
         )
         task_combo.grid(row=0, column=1, sticky="ew")
-        task_combo.bind("<<ComboboxSelected>>", lambda e: self._update_units())
 
         # Input value
         ttk.Label(frm, text="Value:").grid(row=1, column=0, sticky="w")
-        self.value_var = tk.StringVar()
-        ttk.Entry(frm, textvariable=self.value_var).grid(row=1, column=1, sticky="ew")
+        self.value_entry = ttk.Entry(frm)
+        self.value_entry.grid(row=1, column=1, sticky="ew")
 
         # Input unit
         ttk.Label(frm, text="From:").grid(row=2, column=0, sticky="w")
-        self.from_var = tk.StringVar()
-        self.from_combo = ttk.Combobox(
-            frm, textvariable=self.from_var, state="readonly"
-        )
+        self.from_combo = ttk.Combobox(frm, state="readonly")
         self.from_combo.grid(row=2, column=1, sticky="ew")
 
         # Output unit
         ttk.Label(frm, text="To:").grid(row=3, column=0, sticky="w")
-        self.to_var = tk.StringVar()
-        self.to_combo = ttk.Combobox(frm, textvariable=self.to_var, state="readonly")
+        self.to_combo = ttk.Combobox(frm, state="readonly")
         self.to_combo.grid(row=3, column=1, sticky="ew")
 
         # Convert button
@@ -62,37 +57,44 @@ class ConverterGUI(tk.Tk):
         convert_btn.grid(row=4, column=0, columnspan=2, pady=(8, 0))
 
         # Result
-        self.result_var = tk.StringVar(value="")
-        ttk.Label(frm, textvariable=self.result_var, font=[None, 11, "bold"]).grid(
-            row=5, column=0, columnspan=2, pady=(8, 0)
-        )
+        self.result_label = ttk.Label(frm, text="", font=[None, 11, "bold"])
+        self.result_label.grid(row=5, column=0, columnspan=2, pady=(8, 0))
 
         for i in range(2):
             frm.columnconfigure(i, weight=1)
 
+        self._units: list[str] | None = None
+        self.task_var.trace_add("write", self._on_task_changed)
+        self._on_task_changed()
+
+    def _on_task_changed(self, *args) -> None:
+        self._task = self.task_var.get()
         self._update_units()
 
     def _update_units(self) -> None:
-        task = self.task_var.get().strip().lower()
-        if task.startswith("t"):
+        if self._task.strip().lower().startswith("t"):
             units = TEMP_UNITS
         else:
             units = LEN_UNITS
+        # the unit lists only change when switching between tasks
+        if units is self._units:
+            return
+        self._units = units
         # keep selections if possible
-        cur_from = self.from_var.get()
-        cur_to = self.to_var.get()
+        cur_from = self.from_combo.get()
+        cur_to = self.to_combo.get()
         self.from_combo.config(values=units)
         self.to_combo.config(values=units)
         if cur_from not in units:
-            self.from_var.set(units[0])
+            self.from_combo.set(units[0])
         if cur_to not in units:
-            self.to_var.set(units[1] if len(units) > 1 else units[0])
+            self.to_combo.set(units[1] if len(units) > 1 else units[0])
 
     def _on_convert(self) -> None:
-        task = self.task_var.get()
-        raw = self.value_var.get().strip()
-        from_u = self.from_var.get()
-        to_u = self.to_var.get()
+        task = self._task
+        raw = self.value_entry.get().strip()
+        from_u = self.from_combo.get()
+        to_u = self.to_combo.get()
         try:
             v = float(raw)
         except Exception:
@@ -108,7 +110,7 @@ class ConverterGUI(tk.Tk):
             out_str = f"{out:.6g}"
         else:
             out_str = f"{out:.6f}".rstrip("0").rstrip(".")
-        self.result_var.set(f"{v} {from_u} → {out_str} {to_u}")
+        self.result_label.config(text=f"{v} {from_u} → {out_str} {to_u}")
 
 
 def main() -> int:
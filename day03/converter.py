@@ -11,30 +11,84 @@ Unit names are case-insensitive and common synonyms are accepted.
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Tuple
 
-import pint
-
-# Initialize pint unit registry
-ureg = pint.UnitRegistry()
-
 TEMP_UNITS = ["C", "F", "K"]
 LEN_UNITS = ["cm", "inch"]
 
+_UNIT_ALIASES = {
+    "c": "c",
+    "celsius": "c",
+    "centigrade": "c",
+    "f": "f",
+    "fahrenheit": "f",
+    "k": "k",
+    "kelvin": "k",
+    "cm": "cm",
+    "centimeter": "cm",
+    "centimeters": "cm",
+    "in": "in",
+    "inch": "in",
+    "inches": "in",
+}
+
+_TASK_ALIASES = {
+    "temperature": "t",
+    "temp": "t",
+    "t": "t",
+    "length": "l",
+    "len": "l",
+    "l": "l",
+}
+
+_TEMP_CONVERSIONS = {
+    ("c", "f"): lambda v: v * 9.0 / 5.0 + 32.0,
+    ("c", "k"): lambda v: v + 273.15,
+    ("f", "c"): lambda v: (v - 32.0) * 5.0 / 9.0,
+    ("f", "k"): lambda v: (v - 32.0) * 5.0 / 9.0 + 273.15,
+    ("k", "c"): lambda v: v - 273.15,
+    ("k", "f"): lambda v: (v - 273.15) * 9.0 / 5.0 + 32.0,
+}
+
+_LEN_CONVERSIONS = {
+    ("cm", "in"): lambda v: v / 2.54,
+    ("in", "cm"): lambda v: v * 2.54,
+}
+
+_CONVERSIONS = {"t": _TEMP_CONVERSIONS, "l": _LEN_CONVERSIONS}
+_TASK_UNITS = {"t": ("c", "f", "k"), "l": ("cm", "in")}
+
+
+@lru_cache(maxsize=64)
 def _normalize_unit(unit: str) -> str:
-    """Normalize unit names to pint-compatible format."""
-    u = unit.strip().lower()
-    if u in ("c", "celsius", "centigrade"):
-        return "degC"
-    if u in ("f", "fahrenheit"):
-        return "degF"
-    if u in ("k", "kelvin"):
-        return "kelvin"
-    if u in ("cm", "centimeter", "centimeters"):
-        return "cm"
-    if u in ("in", "inch", "inches"):
-        return "inch"
-    raise ValueError(f"Unknown unit: {unit}")
+    u = _UNIT_ALIASES.get(unit.strip().lower())
+    if u is None:
+        raise ValueError(f"Unknown unit: {unit}")
+    return u
+
+
+@lru_cache(maxsize=64)
+def _normalize_task(task: str) -> str:
+    t = _TASK_ALIASES.get(task.strip().lower())
+    if t is None:
+        raise ValueError(f"Unknown task: {task}")
+    return t
+
+
+@lru_cache(maxsize=4096)
+def _convert_normalized(t: str, value: float, from_u: str, to_u: str) -> float:
+    """Convert using already normalized task ('t'/'l') and unit tokens."""
+    if from_u == to_u and from_u in _TASK_UNITS[t]:
+        return round(float(value), 5)
+
+    conversions = _CONVERSIONS[t]
+    key = (from_u, to_u)
+    if key not in conversions:
+        raise ValueError(f"Cannot convert {from_u} to {to_u}")
+
+    # Round to 5 decimal places to avoid floating point precision issues
+    return round(conversions[key](value), 5)
 
 
 def convert(task: str, value: float, from_unit: str, to_unit: str) -> float:
@@ -43,35 +97,33 @@ def convert(task: str, value: float, from_unit: str, to_unit: str) -> float:
     task: 'temperature' or 'length' (case-insensitive, accepts 'temp', 't', 'len')
     Raises ValueError on unknown units or tasks.
     """
-    t = task.strip().lower()
-
+    t = _normalize_task(task)
     try:
-        # Normalize units to pint format
-        from_pint = _normalize_unit(from_unit)
-        to_pint = _normalize_unit(to_unit)
-
-        # Create quantity with pint
-        quantity = ureg.Quantity(value, from_pint)
-
-        # Convert to target unit
-        result = quantity.to(to_pint)
-
-        # Round to 12 decimal places to avoid floating point precision issues
-        return round(result.magnitude, 5)
-    except (pint.errors.DimensionalityError, pint.errors.UndefinedUnitError) as e:
-        raise ValueError(f"Cannot convert {from_unit} to {to_unit}: {e}")
-    except Exception as e:
-        raise ValueError(f"Conversion error: {e}")
+        from_u = _normalize_unit(from_unit)
+        to_u = _normalize_unit(to_unit)
+    except ValueError as e:
+        raise ValueError(f"Conversion error: {e}") from None
+    try:
+        return _convert_normalized(t, value, from_u, to_u)
+    except ValueError:
+        # report the units as the caller spelled them, not the normalized tokens
+        raise ValueError(f"Cannot convert {from_unit} to {to_unit}") from None
+
+
 def parse_line(line: str) -> Tuple[str, float, str, str]:
     """Parse a CSV-ish line: task,input_value,input_unit,output_unit
 
     Returns (task, value, input_unit, output_unit)
     Raises ValueError on malformed lines.
     """
-    parts = [p.strip() for p in line.strip().split(",")]
+    parts = line.strip().split(",", 3)
     if len(parts) < 4:
         raise ValueError("Each line must have 4 comma-separated fields: task,input_value,input_unit,output_unit")
-    task, raw_val, in_unit, out_unit = parts[:4]
+    task, raw_val, in_unit, rest = parts
+    task = task.strip()
+    raw_val = raw_val.strip()
+    in_unit = in_unit.strip()
+    out_unit = rest.split(",", 1)[0].strip()
     try:
         val = float(raw_val)
     except Exception:
@@ -13,10 +13,16 @@ from __future__ import annotations
 import argparse
 import os
 import sys
-import csv
 from typing import List
 
-from converter import convert, TEMP_UNITS, LEN_UNITS
+from converter import (
+    convert,
+    TEMP_UNITS,
+    LEN_UNITS,
+    _convert_normalized,
+    _normalize_task,
+    _normalize_unit,
+)
 
 
 def interactive_mode() -> None:
@@ -71,27 +77,39 @@ def process_file(path: str) -> str:
     if not os.path.exists(path):
         raise FileNotFoundError(path)
     out_path = _output_path_for(path)
-    results: List[str] = []
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.reader(
-            line for line in f if line.strip() and not line.lstrip().startswith("#")
-        )
-        for lineno, parts in enumerate(reader, start=1):
+    with open(path, "r", encoding="utf-8") as f, open(
+        out_path, "w", encoding="utf-8"
+    ) as of:
+        of.write("# task,input_value,input_unit,output_value,output_unit\n")
+        lineno = 0
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            lineno += 1
+            # plain task,value,in,out records: no quoting, extra fields ignored
+            parts = line.split(",", 4)
             try:
                 if len(parts) < 4:
                     raise ValueError("need 4 fields")
                 task = parts[0].strip()
-                val = float(parts[1].strip())
+                val = float(parts[1])
                 in_unit = parts[2].strip()
                 out_unit = parts[3].strip()
-                out_val = convert(task, val, in_unit, out_unit)
-                results.append(f"{task},{val},{in_unit},{out_val},{out_unit}")
+                t = _normalize_task(task)
+                try:
+                    from_u = _normalize_unit(in_unit)
+                    to_u = _normalize_unit(out_unit)
+                except ValueError as e:
+                    raise ValueError(f"Conversion error: {e}") from None
+                try:
+                    out_val = _convert_normalized(t, val, from_u, to_u)
+                except ValueError:
+                    msg = f"Cannot convert {in_unit} to {out_unit}"
+                    raise ValueError(msg) from None
+                of.write(f"{task},{val},{in_unit},{out_val},{out_unit}\n")
             except Exception as e:
-                results.append(f"ERROR,line {lineno},{','.join(parts)},{e}")
-    with open(out_path, "w", encoding="utf-8") as of:
-        of.write("# task,input_value,input_unit,output_value,output_unit\n")
-        for r in results:
-            of.write(r + "\n")
+                of.write(f"ERROR,line {lineno},{','.join(parts)},{e}\n")
     return out_path
 
 
@@ -20,3 +20,29 @@ length,2.54,cm,in
     assert "# task,input_value,input_unit,output_value,output_unit" in data
     assert "temperature,32.0,F,0.0,C" in data
     assert "length,2.54,cm,1.0,in" in data
+
+
+def test_process_file_error_and_skipped_lines(tmp_path: Path):
+    content = """# header comment
+temperature,32,F,C
+
+   # indented comment
+length,2.54,cm,in,extra,fields
+temperature,abc,C,F
+temperature,10,C,X
+length,5
+  temperature , 100 , C , K
+"""
+    in_path = tmp_path / "input.txt"
+    in_path.write_text(content, encoding="utf-8")
+    out_path = process_file(str(in_path))
+    # expected lines match the output of the original csv.reader implementation
+    assert Path(out_path).read_text(encoding="utf-8").splitlines() == [
+        "# task,input_value,input_unit,output_value,output_unit",
+        "temperature,32.0,F,0.0,C",
+        "length,2.54,cm,1.0,in",
+        "ERROR,line 3,temperature,abc,C,F,could not convert string to float: 'abc'",
+        "ERROR,line 4,temperature,10,C,X,Conversion error: Unknown unit: X",
+        "ERROR,line 5,length,5,need 4 fields",
+        "temperature,100.0,C,373.15,K",
+    ]
@@ -29,3 +29,20 @@ def test_length_in_to_cm():
 def test_invalid_unit():
     with pytest.raises(ValueError):
         convert("temperature", 10, "m", "c")
+
+
+def test_incompatible_units_error_names_given_units():
+    with pytest.raises(ValueError, match="Cannot convert Celsius to cm"):
+        convert("temperature", 10, "Celsius", "cm")
+
+
+def test_unknown_task():
+    with pytest.raises(ValueError, match="Unknown task: foo"):
+        convert("foo", 1, "c", "f")
+
+
+def test_units_not_matching_task():
+    with pytest.raises(ValueError):
+        convert("length", 1, "c", "f")
+    with pytest.raises(ValueError):
+        convert("temperature", 1, "cm", "cm")
@@ -14,7 +14,19 @@ from typing import Dict
 from config import Config
 from pubmed_client import PubMedClient
 from data_processor import DataProcessor
-from ui_components import UIComponents
+from ui_components import get_ui
+
+
+@st.cache_resource
+def get_shared_client() -> PubMedClient:
+    """Return the PubMedClient shared across reruns and sessions."""
+    return PubMedClient()
+
+
+@st.cache_resource
+def get_shared_processor() -> DataProcessor:
+    """Return the DataProcessor shared across reruns and sessions."""
+    return DataProcessor()
 
 
 class GeneTracker:
@@ -22,7 +34,7 @@ class GeneTracker:
 
     def __init__(self):
         """Initialize the application."""
-        self.ui = UIComponents()
+        self.ui = get_ui()
         self.client = None
         self.processor = None
         self.initialize_session_state()
@@ -39,15 +51,26 @@ class GeneTracker:
             st.session_state.selected_genes = []
 
     def get_client(self) -> PubMedClient:
-        """Get or create PubMed client instance."""
+        """
+        Get the shared PubMed client instance.
+
+        The client outlives reruns, so the genes it has validated are
+        remembered without a separate session copy.
+        """
         if self.client is None:
-            self.client = PubMedClient()
+            self.client = get_shared_client()
         return self.client
 
     def get_processor(self) -> DataProcessor:
-        """Get or create DataProcessor instance."""
+        """
+        Get the shared DataProcessor instance.
+
+        The processor outlives reruns, so its in-memory cache of parsed files
+        (re-checked against file mtime/size and cache age on every load) is
+        reused across searches.
+        """
         if self.processor is None:
-            self.processor = DataProcessor()
+            self.processor = get_shared_processor()
         return self.processor
 
     def handle_example_click(self, gene: str):
@@ -59,6 +82,7 @@ class GeneTracker:
         """Handle clear cache button click."""
         processor = self.get_processor()
         processor.clear_cache()
+        self.get_client().clear_validated_genes()
         st.session_state.gene_data = None
 
     def handle_clear_history(self):
@@ -92,10 +116,7 @@ class GeneTracker:
                 cached_data = processor.load_from_cache(gene, cache_days)
 
             if cached_data:
-                yearly_counts = {
-                    int(year): count
-                    for year, count in cached_data["yearly_counts"].items()
-                }
+                yearly_counts = cached_data["yearly_counts"]
                 self.ui.show_info(self.ui.config.MESSAGE_CACHED)
             else:
                 # Validate gene
@@ -13,8 +13,10 @@ class Config:
     PUBMED_EMAIL: Optional[str] = os.getenv("PUBMED_EMAIL", "user@example.com")
     PUBMED_API_KEY: Optional[str] = os.getenv("PUBMED_API_KEY", None)
 
-    # Rate limiting (seconds between requests)
-    RATE_LIMIT_NO_KEY: float = 0.34
+    # Rate limiting (seconds between requests). Must not be shorter than
+    # Bio.Entrez's own unlocked throttle (0.37s without a key, 0.1s with one),
+    # or concurrent requests race past it
+    RATE_LIMIT_NO_KEY: float = 0.37
     RATE_LIMIT_WITH_KEY: float = 0.1
 
     # Data settings
@@ -4,17 +4,58 @@ Data Processor for Gene Trend Tracker.
 Handles data processing, caching, and organization of publication data.
 """
 
-import json
+import logging
 import os
-from typing import Dict, Optional
+import tempfile
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
+
+import numpy as np
+import orjson
+
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+
+# Deletes every ASCII character that is not alphanumeric, "-" or "_"
+_UNSAFE_ASCII = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if not (c.isalnum() or c in "-_"))
+)
+
+
+def _sanitize_gene(gene: str) -> str:
+    """Reduce a gene name to a lowercase, filename-safe string."""
+    if gene.isascii():
+        return gene.translate(_UNSAFE_ASCII).lower()
+    return "".join(c for c in gene if c.isalnum() or c in "-_").lower()
+
+
+@lru_cache(maxsize=4096)
+def _cache_path(cache_dir: Path, gene: str) -> Path:
+    """Build the cache file path for a gene, reused across calls."""
+    return cache_dir / f"{_sanitize_gene(gene)}.json"
+
 
 class DataProcessor:
     """Process and cache gene publication data."""
 
+    # Status labels indexed by how many thresholds the trend change exceeds
+    _TREND_THRESHOLDS = (
+        Config.TREND_DECLINING_THRESHOLD,
+        Config.TREND_GROWING_THRESHOLD,
+        Config.TREND_HOT_THRESHOLD,
+    )
+    _TREND_LABELS = ("📉 Declining", "📊 Stable", "📈 Growing", "🔥 Hot Topic")
+
+    # Number of parsed cache files kept in memory by load_from_cache
+    _MEM_CACHE_SIZE = 128
+
     def __init__(self, cache_dir: Optional[str] = None):
         """
         Initialize the data processor.
@@ -24,6 +65,12 @@ class DataProcessor:
         """
         self.cache_dir = Path(cache_dir or Config.CACHE_DIR)
         self.cache_dir.mkdir(exist_ok=True)
+        # Cache file name -> (mtime, gene name) for list_cached_genes
+        self._list_cache: Dict[str, Tuple[int, str]] = {}
+        # Cache file name -> ((mtime, size), parsed data) for load_from_cache
+        self._mem_cache: OrderedDict[str, Tuple[Tuple[int, int], Dict]] = OrderedDict()
+        # The app shares one processor across sessions, so guard the memo
+        self._mem_lock = threading.Lock()
 
     def _get_cache_path(self, gene: str) -> Path:
         """
@@ -35,9 +82,7 @@ class DataProcessor:
         Returns:
             Path to cache file
         """
-        # Sanitize gene name for filename
-        safe_gene = "".join(c for c in gene if c.isalnum() or c in "-_").lower()
-        return self.cache_dir / f"{safe_gene}.json"
+        return _cache_path(self.cache_dir, gene)
 
     def load_from_cache(self, gene: str, max_age_days: int = 30) -> Optional[Dict]:
         """
@@ -48,32 +93,77 @@ class DataProcessor:
             max_age_days: Maximum age of cache in days
 
         Returns:
-            Cached data dictionary or None if not available/expired
+            Cached data dictionary (yearly_counts keyed by int year) or None if
+            not available/expired
         """
         cache_path = self._get_cache_path(gene)
 
-        if not cache_path.exists():
+        try:
+            stat = cache_path.stat()
+        except FileNotFoundError:
+            with self._mem_lock:
+                self._mem_cache.pop(cache_path.name, None)
             return None
 
         try:
-            with open(cache_path, "r") as f:
-                data = json.load(f)
+            # Reuse the parsed file while it is unchanged on disk
+            file_key = (stat.st_mtime_ns, stat.st_size)
+            with self._mem_lock:
+                cached = self._mem_cache.get(cache_path.name)
+                if cached and cached[0] == file_key:
+                    self._mem_cache.move_to_end(cache_path.name)
+            if cached and cached[0] == file_key:
+                data = cached[1]
+            else:
+                data = self._read_cache_file(cache_path)
+                with self._mem_lock:
+                    self._mem_cache[cache_path.name] = (file_key, data)
+                    self._mem_cache.move_to_end(cache_path.name)
+                    if len(self._mem_cache) > self._MEM_CACHE_SIZE:
+                        self._mem_cache.popitem(last=False)
 
             # Check cache age
             cache_date = datetime.fromisoformat(data.get("cached_at", "2000-01-01"))
             age_days = (datetime.now() - cache_date).days
 
             if age_days > max_age_days:
-                print(f"Cache expired (age: {age_days} days)")
+                logger.info("Cache expired (age: %d days)", age_days)
                 return None
 
-            print(f"Loaded from cache (age: {age_days} days)")
-            return data
+            logger.info("Loaded from cache (age: %d days)", age_days)
+            # Hand out a copy so callers cannot change the memoized data
+            return {
+                **data,
+                "yearly_counts": dict(data["yearly_counts"]),
+                "metadata": dict(data.get("metadata") or {}),
+            }
 
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            print(f"Error reading cache: {e}")
+        except (orjson.JSONDecodeError, KeyError, ValueError) as e:
+            logger.warning("Error reading cache: %s", e)
             return None
 
+    def _read_cache_file(self, cache_path: Path) -> Dict:
+        """
+        Parse a cache file into its data dictionary.
+
+        Args:
+            cache_path: Path to cache file
+
+        Returns:
+            Cached data with yearly_counts keyed by int year
+        """
+        data = orjson.loads(cache_path.read_bytes())
+
+        # Rebuild the year -> count mapping from the parallel arrays,
+        # falling back to the older string-keyed layout
+        if "years" in data:
+            data["yearly_counts"] = dict(zip(data.pop("years"), data.pop("counts")))
+        else:
+            data["yearly_counts"] = {
+                int(year): count for year, count in data["yearly_counts"].items()
+            }
+        return data
+
     def save_to_cache(
         self, gene: str, yearly_counts: Dict[int, int], metadata: Optional[Dict] = None
     ):
@@ -86,22 +176,42 @@ class DataProcessor:
             metadata: Optional additional metadata
         """
         cache_path = self._get_cache_path(gene)
+        years = sorted(yearly_counts)
 
         data = {
             "gene": gene,
             "cached_at": datetime.now().isoformat(),
-            "yearly_counts": {
-                str(year): count for year, count in yearly_counts.items()
-            },
+            "years": years,
+            "counts": [yearly_counts[year] for year in years],
             "metadata": metadata or {},
         }
 
+        tmp_path = None
         try:
-            with open(cache_path, "w") as f:
-                json.dump(data, f, indent=2)
-            print(f"Data cached for {gene}")
+            # Write to a uniquely named temp file and rename it into place, so
+            # readers never see a partial file and concurrent saves of the
+            # same gene cannot interleave
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_dir,
+                prefix=f"{cache_path.stem}.",
+                suffix=".tmp",
+                delete=False,
+            ) as tmp_file:
+                tmp_path = tmp_file.name
+                tmp_file.write(orjson.dumps(data))
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+            with self._mem_lock:
+                self._mem_cache.pop(cache_path.name, None)
+            logger.info("Data cached for %s", gene)
         except IOError as e:
-            print(f"Error writing cache: {e}")
+            logger.warning("Error writing cache: %s", e)
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except FileNotFoundError:
+                    pass
 
     def process_yearly_data(self, yearly_counts: Dict[int, int]) -> Dict:
         """
@@ -117,31 +227,33 @@ class DataProcessor:
             return {}
 
         years = sorted(yearly_counts.keys())
-        counts = [yearly_counts[year] for year in years]
+        counts = np.fromiter(
+            (yearly_counts[year] for year in years), dtype=np.int64, count=len(years)
+        )
 
-        total_pubs = sum(counts)
-        avg_pubs = total_pubs / len(counts) if counts else 0
-        peak_year = max(yearly_counts.items(), key=lambda x: x[1])
+        total_pubs = int(counts.sum())
+        avg_pubs = float(counts.mean())
+        peak_idx = int(counts.argmax())
 
         # Calculate recent trend (last 5 years vs previous 5 years)
+        recent_5 = int(counts[-5:].sum())
+        previous_5 = int(counts[-10:-5].sum())
         if len(years) >= 10:
-            recent_5 = sum(counts[-5:])
-            previous_5 = sum(counts[-10:-5])
             trend_change = (
                 ((recent_5 - previous_5) / previous_5 * 100) if previous_5 > 0 else 0
             )
         else:
-            recent_5 = sum(counts[-5:]) if len(counts) >= 5 else sum(counts)
             trend_change = 0
 
         return {
             "years": years,
-            "counts": counts,
+            "counts": counts.tolist(),
             "total_publications": total_pubs,
             "average_per_year": round(avg_pubs, 1),
-            "peak_year": peak_year[0],
-            "peak_count": peak_year[1],
+            "peak_year": years[peak_idx],
+            "peak_count": int(counts[peak_idx]),
             "recent_5_year_count": recent_5,
+            "previous_5_year_count": previous_5,
             "trend_change_percent": round(trend_change, 1),
         }
 
@@ -155,23 +267,37 @@ class DataProcessor:
         Returns:
             Status string
         """
-        if trend_change_percent > Config.TREND_HOT_THRESHOLD:
-            return "🔥 Hot Topic"
-        elif trend_change_percent > Config.TREND_GROWING_THRESHOLD:
-            return "📈 Growing"
-        elif trend_change_percent > Config.TREND_DECLINING_THRESHOLD:
-            return "📊 Stable"
-        else:
-            return "📉 Declining"
+        return self._TREND_LABELS[
+            bisect_left(self._TREND_THRESHOLDS, trend_change_percent)
+        ]
+
+    def determine_trend_status_batch(self, trend_change_percents) -> np.ndarray:
+        """
+        Determine trend statuses for many percentage changes at once.
+
+        Args:
+            trend_change_percents: Sequence of percentage changes
+
+        Returns:
+            Array of status strings, one per input value
+        """
+        idx = np.searchsorted(
+            self._TREND_THRESHOLDS, trend_change_percents, side="left"
+        )
+        return np.array(self._TREND_LABELS)[idx]
 
     def clear_cache(self):
         """Clear all cached data."""
-        import shutil
-
+        with self._mem_lock:
+            self._mem_cache.clear()
+        self._list_cache.clear()
         if self.cache_dir.exists():
-            shutil.rmtree(self.cache_dir)
-            self.cache_dir.mkdir(exist_ok=True)
-            print("Cache cleared")
+            # Remove the cache files but keep the directory itself
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        os.unlink(entry.path)
+            logger.info("Cache cleared")
 
     def list_cached_genes(self) -> list:
         """
@@ -184,19 +310,53 @@ class DataProcessor:
             return []
 
         cached_genes = []
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
-                    cached_genes.append(data.get("gene", cache_file.stem))
-            except (json.JSONDecodeError, IOError):
-                continue
-
+        list_cache = {}
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not (
+                    entry.name.endswith(".json")
+                    and entry.is_file(follow_symlinks=False)
+                ):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime_ns
+                    cached = self._list_cache.get(entry.name)
+                    if cached and cached[0] == mtime:
+                        gene = cached[1]
+                    else:
+                        gene = self._read_cached_gene(Path(entry.path))
+                except (orjson.JSONDecodeError, IOError):
+                    continue
+                list_cache[entry.name] = (mtime, gene)
+                cached_genes.append(gene)
+
+        self._list_cache = list_cache
         return sorted(cached_genes)
 
+    def _read_cached_gene(self, cache_file: Path) -> str:
+        """
+        Read the gene name stored in a cache file.
+
+        Args:
+            cache_file: Path to cache file
+
+        Returns:
+            Gene name, or the file stem if the file has no gene field
+
+        Raises:
+            orjson.JSONDecodeError: If the file is not valid JSON
+        """
+        # Cache files are small, so a full parse is cheap and rejects
+        # truncated or corrupt files just like load_from_cache does
+        data = orjson.loads(cache_file.read_bytes())
+        if isinstance(data, dict):
+            return data.get("gene", cache_file.stem)
+        return cache_file.stem
+
 
 def main():
     """Example usage of the data processor."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     processor = DataProcessor()
 
     # Example data
@@ -231,10 +391,7 @@ def main():
     # Load and process
     cached = processor.load_from_cache(gene)
     if cached:
-        yearly_counts = {
-            int(year): count for year, count in cached["yearly_counts"].items()
-        }
-        stats = processor.process_yearly_data(yearly_counts)
+        stats = processor.process_yearly_data(cached["yearly_counts"])
 
         print(f"\n=== Statistics for {gene} ===")
         print(f"Total publications: {stats['total_publications']}")
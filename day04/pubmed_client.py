@@ -6,15 +6,29 @@ and retrieve publication counts for specific genes over time.
 """
 
 from Bio import Entrez
+import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Callable
 from datetime import datetime
 from config import Config
 
+logger = logging.getLogger(__name__)
+
 
 class PubMedClient:
     """Client for interacting with the NCBI E-utilities API via Bio.Entrez."""
 
+    __slots__ = (
+        "email",
+        "api_key",
+        "rate_limit_delay",
+        "_rate_lock",
+        "_next_request_time",
+        "_validated_genes",
+    )
+
     def __init__(self, email: Optional[str] = None, api_key: Optional[str] = None):
         """
         Initialize the PubMed client.
@@ -26,11 +40,9 @@ class PubMedClient:
         self.email = email or Config.PUBMED_EMAIL
         self.api_key = api_key or Config.PUBMED_API_KEY
         self.rate_limit_delay = Config.get_rate_limit_delay(bool(self.api_key))
-
-        # Configure Entrez
-        Entrez.email = self.email
-        if self.api_key:
-            Entrez.api_key = self.api_key
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.0
+        self._validated_genes = set()
 
     def search_gene_publications(self, gene: str, year: Optional[int] = None) -> int:
         """
@@ -49,11 +61,17 @@ class PubMedClient:
             query += f" AND {year}[PDAT]"
 
         try:
-            # Add delay to respect rate limits
-            time.sleep(self.rate_limit_delay)
-
-            # Use Bio.Entrez to search
-            handle = Entrez.esearch(db="pubmed", term=query, retmax=0)
+            # Wait for a free slot to respect rate limits
+            self._wait_for_rate_limit()
+
+            # Use Bio.Entrez to search, passing credentials per call
+            handle = Entrez.esearch(
+                db="pubmed",
+                term=query,
+                retmax=0,
+                email=self.email,
+                api_key=self.api_key,
+            )
             record = Entrez.read(handle)
             handle.close()
 
@@ -63,9 +81,17 @@ class PubMedClient:
             return count
 
         except Exception as e:
-            print(f"Error fetching data from PubMed: {e}")
+            logger.error("Error fetching data from PubMed: %s", e)
             return 0
 
+    def _wait_for_rate_limit(self):
+        """Block until the next request slot allowed by the rate limit."""
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_time)
+            self._next_request_time = slot + self.rate_limit_delay
+        time.sleep(slot - now)
+
     def get_yearly_counts(
         self,
         gene: str,
@@ -86,18 +112,27 @@ class PubMedClient:
             Dictionary mapping years to publication counts
         """
         yearly_counts = {}
-        total_years = end_year - start_year + 1
-
-        print(f"Fetching publication data for {gene} ({start_year}-{end_year})...")
-
-        for idx, year in enumerate(range(start_year, end_year + 1)):
-            count = self.search_gene_publications(gene, year)
-            yearly_counts[year] = count
-            print(f"  {year}: {count} publications")
-
-            # Call progress callback if provided
-            if progress_callback:
-                progress_callback(year, count, idx + 1, total_years)
+        years = range(start_year, end_year + 1)
+        total_years = len(years)
+
+        logger.info(
+            "Fetching publication data for %s (%d-%d)...", gene, start_year, end_year
+        )
+
+        # Requests are paced by _wait_for_rate_limit, so run as many
+        # workers as the rate limit allows requests per second
+        max_workers = max(1, round(1 / self.rate_limit_delay))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            counts = executor.map(
+                lambda year: self.search_gene_publications(gene, year), years
+            )
+            for idx, (year, count) in enumerate(zip(years, counts)):
+                yearly_counts[year] = count
+                logger.info("  %d: %d publications", year, count)
+
+                # Call progress callback if provided
+                if progress_callback:
+                    progress_callback(year, count, idx + 1, total_years)
 
         return yearly_counts
 
@@ -111,12 +146,23 @@ class PubMedClient:
         Returns:
             True if at least one publication is found
         """
-        count = self.search_gene_publications(gene)
-        return count > 0
+        # Only successful lookups are remembered: a failed search also
+        # reports 0 publications and should be retried
+        if gene in self._validated_genes:
+            return True
+        if self.search_gene_publications(gene) > 0:
+            self._validated_genes.add(gene)
+            return True
+        return False
+
+    def clear_validated_genes(self):
+        """Forget which genes were validated, so they are checked again."""
+        self._validated_genes.clear()
 
 
 def main():
     """Example usage of the PubMed client."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     client = PubMedClient()
 
     # Example: Search for TP53 gene
@@ -0,0 +1,14 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, patch
+
+
+@pytest.fixture
+def entrez():
+    """Patch Bio.Entrez esearch and read together with a single patcher."""
+    with patch.multiple("pubmed_client.Entrez", esearch=DEFAULT, read=DEFAULT) as mocks:
+        yield SimpleNamespace(**mocks)
@@ -3,6 +3,7 @@ Unit tests for configuration modules.
 """
 
 import pytest
+from types import MappingProxyType
 from config import Config
 from ui_config import UIConfig
 
@@ -35,7 +36,7 @@ class TestConfig:
 
         Config.PUBMED_API_KEY = old_key
         assert delay == Config.RATE_LIMIT_NO_KEY
-        assert delay == 0.34
+        assert delay == 0.37
 
     def test_rate_limit_delay_with_key(self):
         """Test rate limit with API key."""
@@ -69,8 +70,8 @@ class TestUIConfig:
         assert UIConfig.LAYOUT == "wide"
 
     def test_example_genes(self):
-        """Test example genes list."""
-        assert isinstance(UIConfig.EXAMPLE_GENES, list)
+        """Test example genes tuple."""
+        assert isinstance(UIConfig.EXAMPLE_GENES, tuple)
         assert len(UIConfig.EXAMPLE_GENES) > 0
         assert "TP53" in UIConfig.EXAMPLE_GENES
         assert "BRCA1" in UIConfig.EXAMPLE_GENES
@@ -84,7 +85,7 @@ class TestUIConfig:
 
     def test_colors(self):
         """Test color configuration."""
-        assert isinstance(UIConfig.COLORS, dict)
+        assert isinstance(UIConfig.COLORS, MappingProxyType)
         assert "hot" in UIConfig.COLORS
         assert "growing" in UIConfig.COLORS
         assert "stable" in UIConfig.COLORS
@@ -92,7 +93,7 @@ class TestUIConfig:
 
     def test_multi_gene_colors(self):
         """Test multi-gene color palette."""
-        assert isinstance(UIConfig.MULTI_GENE_COLORS, list)
+        assert isinstance(UIConfig.MULTI_GENE_COLORS, tuple)
         assert len(UIConfig.MULTI_GENE_COLORS) >= 8
 
     def test_interpretation_templates(self):
@@ -4,9 +4,7 @@ Unit tests for Data Processor.
 
 import pytest
 import json
-import tempfile
-import shutil
-from pathlib import Path
+import os
 from datetime import datetime, timedelta
 from data_processor import DataProcessor
 
@@ -15,22 +13,15 @@ class TestDataProcessor:
     """Test cases for DataProcessor class."""
 
     @pytest.fixture
-    def temp_cache_dir(self):
-        """Create a temporary cache directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir)
-
-    @pytest.fixture
-    def processor(self, temp_cache_dir):
+    def processor(self, tmp_path):
         """Create a DataProcessor instance with temporary cache."""
-        return DataProcessor(cache_dir=temp_cache_dir)
+        return DataProcessor(cache_dir=str(tmp_path))
 
-    def test_processor_initialization(self, temp_cache_dir):
+    def test_processor_initialization(self, tmp_path):
         """Test processor initialization."""
-        processor = DataProcessor(cache_dir=temp_cache_dir)
+        processor = DataProcessor(cache_dir=str(tmp_path))
         assert processor.cache_dir.exists()
-        assert processor.cache_dir == Path(temp_cache_dir)
+        assert processor.cache_dir == tmp_path
 
     def test_save_and_load_cache(self, processor):
         """Test saving and loading cache data."""
@@ -46,8 +37,72 @@ class TestDataProcessor:
         assert cached_data is not None
         assert cached_data["gene"] == gene
         assert len(cached_data["yearly_counts"]) == 3
+        assert cached_data["yearly_counts"] == yearly_counts
+
+    def test_load_reuses_parsed_cache_until_saved(self, processor, monkeypatch):
+        """Test that repeated loads reuse parsed data until the file is rewritten."""
+        reads = []
+        read_cache_file = processor._read_cache_file
+
+        def counting_read(cache_path):
+            reads.append(cache_path)
+            return read_cache_file(cache_path)
+
+        monkeypatch.setattr(processor, "_read_cache_file", counting_read)
+
+        processor.save_to_cache("TP53", {2020: 100})
+        first = processor.load_from_cache("TP53")
+        assert processor.load_from_cache("TP53") == first
+        assert len(reads) == 1
+
+        processor.save_to_cache("TP53", {2020: 100, 2021: 120})
+        reloaded = processor.load_from_cache("TP53")
+        assert reloaded["yearly_counts"] == {2020: 100, 2021: 120}
+        assert len(reads) == 2
+
+    def test_load_returns_independent_copies(self, processor):
+        """Test that changing loaded data does not alter later loads."""
+        processor.save_to_cache("BRCA1", {2020: 50})
+        loaded = processor.load_from_cache("BRCA1")
+        loaded["yearly_counts"][1999] = 5
+        loaded["metadata"]["note"] = "changed"
+
+        reloaded = processor.load_from_cache("BRCA1")
+        assert reloaded["yearly_counts"] == {2020: 50}
+        assert reloaded["metadata"] == {}
+
+    def test_load_legacy_cache_format(self, processor):
+        """Test loading a cache file that stores yearly_counts with string keys."""
+        legacy = {
+            "gene": "EGFR",
+            "cached_at": datetime.now().isoformat(),
+            "yearly_counts": {"2020": 75, "2021": 80},
+            "metadata": {},
+        }
+        processor._get_cache_path("EGFR").write_text(json.dumps(legacy, indent=2))
+
+        cached_data = processor.load_from_cache("EGFR")
+        assert cached_data["yearly_counts"] == {2020: 75, 2021: 80}
+
+    def test_save_leaves_no_temp_files(self, processor):
+        """Test that saves only leave the final cache file behind."""
+        processor.save_to_cache("TP53", {2020: 100})
+        processor.save_to_cache("TP53", {2020: 110})
+
+        assert [p.name for p in processor.cache_dir.iterdir()] == ["tp53.json"]
+
+    def test_failed_save_removes_temp_file(self, processor, monkeypatch):
+        """Test that a failed rename does not leave the temp file behind."""
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("data_processor.os.replace", fail_replace)
+        processor.save_to_cache("TP53", {2020: 100})
+
+        assert list(processor.cache_dir.iterdir()) == []
 
-    def test_cache_expiration(self, processor, temp_cache_dir):
+    def test_cache_expiration(self, processor):
         """Test that old cache is not loaded."""
         gene = "BRCA1"
         yearly_counts = {2020: 50, 2021: 60}
@@ -91,6 +146,8 @@ class TestDataProcessor:
         assert 189.99 <= stats["average_per_year"] <= 190.01
         assert stats["peak_year"] == 2024
         assert stats["peak_count"] == 280
+        assert stats["recent_5_year_count"] == 1200
+        assert stats["previous_5_year_count"] == 700
         assert len(stats["years"]) == 10
         assert len(stats["counts"]) == 10
 
@@ -101,6 +158,16 @@ class TestDataProcessor:
         assert processor.determine_trend_status(5) == "📊 Stable"
         assert processor.determine_trend_status(-20) == "📉 Declining"
 
+    def test_determine_trend_status_batch(self, processor):
+        """Test that batch status matches the scalar version, including boundaries."""
+        changes = [-20, -10, 5, 10, 30, 50, 60]
+        statuses = processor.determine_trend_status_batch(changes)
+
+        assert list(statuses) == [
+            processor.determine_trend_status(change) for change in changes
+        ]
+        assert statuses[5] == "📈 Growing"
+
     def test_clear_cache(self, processor):
         """Test clearing cache."""
         # Add some cache files
@@ -130,6 +197,45 @@ class TestDataProcessor:
         assert "EGFR" in cached_genes
         assert "TP53" in cached_genes
 
+    def test_list_cached_genes_refreshes_changed_files(self, processor):
+        """Test that the listing re-reads files whose mtime changed."""
+        processor.save_to_cache("TP53", {2020: 100})
+        assert processor.list_cached_genes() == ["TP53"]
+
+        # Rewrite the file under a different gene name with a newer mtime
+        cache_path = processor._get_cache_path("TP53")
+        cache_path.write_text(json.dumps({"gene": "tp53-renamed"}))
+        stat = cache_path.stat()
+        os.utime(cache_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert processor.list_cached_genes() == ["tp53-renamed"]
+
+        cache_path.unlink()
+        assert processor.list_cached_genes() == []
+
+    def test_list_cached_genes_skips_corrupt_files(self, processor):
+        """Test that truncated cache files are not listed."""
+        processor.save_to_cache("TP53", {2020: 100})
+        truncated = '{"gene": "BAD", "cached_at": "20'
+        (processor.cache_dir / "bad.json").write_text(truncated)
+
+        assert processor.list_cached_genes() == ["TP53"]
+
+    def test_list_cached_genes_skips_file_missing_last_byte(self, processor):
+        """Test that a cache file cut short by a single byte is not listed."""
+        processor.save_to_cache("TP53", {2020: 100})
+        cache_path = processor._get_cache_path("TP53")
+        cache_path.write_bytes(cache_path.read_bytes()[:-1])
+
+        assert processor.list_cached_genes() == []
+        assert processor.load_from_cache("TP53") is None
+
+    def test_list_cached_genes_reads_top_level_gene(self, processor):
+        """Test that a gene field nested in metadata is not mistaken for the gene."""
+        data = {"metadata": {"gene": "NESTED"}, "gene": "EGFR", "cached_at": ""}
+        (processor.cache_dir / "egfr.json").write_text(json.dumps(data))
+
+        assert processor.list_cached_genes() == ["EGFR"]
+
     def test_sanitized_gene_names(self, processor):
         """Test that gene names are properly sanitized for filenames."""
         gene = "ABC-123_test"
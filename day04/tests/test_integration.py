@@ -5,46 +5,54 @@ These tests verify that different components work together correctly.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 from pubmed_client import PubMedClient
 from data_processor import DataProcessor
 from visualizer import TrendVisualizer
-import tempfile
-import shutil
 
 
-class TestIntegration:
-    """Integration tests for the application."""
+# Hot topic - needs significant recent growth
+HOT_YEARLY_COUNTS = dict(
+    zip(range(2015, 2025), (100, 110, 120, 130, 140, 300, 350, 400, 450, 500))
+)
 
-    @pytest.fixture
-    def temp_cache_dir(self):
-        """Create a temporary cache directory."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+# Declining - needs negative trend
+DECLINING_YEARLY_COUNTS = dict(
+    zip(range(2015, 2025), (500, 480, 460, 440, 420, 300, 280, 260, 240, 220))
+)
+
+# Steady growth of 10 publications per year from 50 to 140
+LINEAR_YEARLY_COUNTS = dict(zip(range(2015, 2025), range(50, 150, 10)))
+
+
+@pytest.fixture(scope="session")
+def temp_cache_dir(tmp_path_factory):
+    """Create a temporary cache directory shared by the whole test session."""
+    return str(tmp_path_factory.mktemp("gene_cache"))
+
+
+@pytest.fixture(scope="module")
+def processor(temp_cache_dir):
+    """Create a data processor with temp cache, shared by the module."""
+    return DataProcessor(cache_dir=temp_cache_dir)
 
-    @pytest.fixture
-    def processor(self, temp_cache_dir):
-        """Create a data processor with temp cache."""
-        return DataProcessor(cache_dir=temp_cache_dir)
+
+class TestIntegration:
+    """Integration tests for the application."""
 
     @pytest.fixture
     def visualizer(self):
         """Create a visualizer instance."""
         return TrendVisualizer()
 
-    @patch("pubmed_client.Entrez.esearch")
-    @patch("pubmed_client.Entrez.read")
-    def test_full_workflow_with_cache(
-        self, mock_read, mock_esearch, processor, visualizer
-    ):
+    def test_full_workflow_with_cache(self, entrez, processor, visualizer):
         """Test complete workflow from search to visualization."""
         # Mock PubMed responses
-        mock_handle = MagicMock()
-        mock_esearch.return_value = mock_handle
+        mock_handle = Mock(spec=["close"])
+        entrez.esearch.return_value = mock_handle
 
         # Validation response
-        mock_read.return_value = {"Count": "100"}
+        entrez.read.return_value = {"Count": "100"}
 
         client = PubMedClient()
 
@@ -52,12 +60,13 @@ class TestIntegration:
         assert client.validate_gene_exists("TP53") is True
 
         # Mock yearly search responses
-        mock_read.side_effect = [{"Count": str(100 + i * 10)} for i in range(5)]
+        entrez.read.side_effect = iter(
+            [{"Count": str(100 + (year - 2020) * 10)} for year in range(2020, 2025)]
+        )
 
         # Get yearly counts
         yearly_counts = {}
         for year in range(2020, 2025):
-            mock_read.return_value = {"Count": str(100 + (year - 2020) * 10)}
             yearly_counts[year] = client.search_gene_publications("TP53", year)
 
         # Cache the data
@@ -78,12 +87,10 @@ class TestIntegration:
         assert fig is not None
         assert len(fig.data) == 2
 
-    @patch("pubmed_client.Entrez.esearch")
-    @patch("pubmed_client.Entrez.read")
-    def test_multi_gene_workflow(self, mock_read, mock_esearch, processor, visualizer):
+    def test_multi_gene_workflow(self, entrez, processor, visualizer):
         """Test workflow with multiple genes."""
-        mock_handle = MagicMock()
-        mock_esearch.return_value = mock_handle
+        mock_handle = Mock(spec=["close"])
+        entrez.esearch.return_value = mock_handle
 
         client = PubMedClient()
         genes = ["TP53", "BRCA1"]
@@ -91,7 +98,7 @@ class TestIntegration:
 
         for gene in genes:
             # Validate
-            mock_read.return_value = {"Count": "100"}
+            entrez.read.return_value = {"Count": "100"}
             assert client.validate_gene_exists(gene) is True
 
             # Get yearly data (simplified)
@@ -110,43 +117,19 @@ class TestIntegration:
         assert fig is not None
         assert len(fig.data) == len(genes)
 
-    def test_trend_status_workflow(self, processor):
+    @pytest.mark.parametrize(
+        "yearly_counts,expected",
+        [
+            (HOT_YEARLY_COUNTS, ("Hot Topic", "Growing")),
+            (DECLINING_YEARLY_COUNTS, ("Declining",)),
+        ],
+        ids=["hot", "declining"],
+    )
+    def test_trend_status_workflow(self, processor, yearly_counts, expected):
         """Test trend status determination workflow."""
-        # Hot topic - needs significant recent growth
-        yearly_counts_hot = {
-            2015: 100,
-            2016: 110,
-            2017: 120,
-            2018: 130,
-            2019: 140,
-            2020: 300,
-            2021: 350,
-            2022: 400,
-            2023: 450,
-            2024: 500,
-        }
-        stats_hot = processor.process_yearly_data(yearly_counts_hot)
-        status_hot = processor.determine_trend_status(stats_hot["trend_change_percent"])
-        assert "Hot Topic" in status_hot or "Growing" in status_hot
-
-        # Declining - needs negative trend
-        yearly_counts_decline = {
-            2015: 500,
-            2016: 480,
-            2017: 460,
-            2018: 440,
-            2019: 420,
-            2020: 300,
-            2021: 280,
-            2022: 260,
-            2023: 240,
-            2024: 220,
-        }
-        stats_decline = processor.process_yearly_data(yearly_counts_decline)
-        status_decline = processor.determine_trend_status(
-            stats_decline["trend_change_percent"]
-        )
-        assert "Declining" in status_decline
+        stats = processor.process_yearly_data(yearly_counts)
+        status = processor.determine_trend_status(stats["trend_change_percent"])
+        assert any(label in status for label in expected)
 
     def test_cache_persistence(self, processor):
         """Test that cached data persists correctly."""
@@ -199,31 +182,13 @@ class TestIntegration:
 class TestDataFlow:
     """Test data flow through the system."""
 
-    @pytest.fixture
-    def temp_cache_dir(self):
-        """Create a temporary cache directory."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir)
-
-    def test_data_transformation_pipeline(self, temp_cache_dir):
+    def test_data_transformation_pipeline(self, tmp_path):
         """Test complete data transformation from API to visualization."""
         # Simulate API response
-        raw_yearly_data = {
-            2015: 50,
-            2016: 60,
-            2017: 70,
-            2018: 80,
-            2019: 90,
-            2020: 100,
-            2021: 110,
-            2022: 120,
-            2023: 130,
-            2024: 140,
-        }
+        raw_yearly_data = LINEAR_YEARLY_COUNTS
 
         # Process
-        processor = DataProcessor(cache_dir=temp_cache_dir)
+        processor = DataProcessor(cache_dir=str(tmp_path))
         stats = processor.process_yearly_data(raw_yearly_data)
 
         # Verify transformations
@@ -240,13 +205,11 @@ class TestDataFlow:
         expected_trend = ((recent_5 - previous_5) / previous_5) * 100
         assert abs(stats["trend_change_percent"] - expected_trend) < 0.1
 
-    @patch("pubmed_client.Entrez.esearch")
-    @patch("pubmed_client.Entrez.read")
-    def test_progress_callback_integration(self, mock_read, mock_esearch):
+    def test_progress_callback_integration(self, entrez):
         """Test that progress callbacks work correctly."""
-        mock_handle = MagicMock()
-        mock_esearch.return_value = mock_handle
-        mock_read.return_value = {"Count": "100"}
+        mock_handle = Mock(spec=["close"])
+        entrez.esearch.return_value = mock_handle
+        entrez.read.return_value = {"Count": "100"}
 
         progress_calls = []
 
@@ -2,11 +2,19 @@
 Unit tests for PubMed Client.
 """
 
+import time
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 from pubmed_client import PubMedClient
 
 
+@pytest.fixture(scope="module")
+def client():
+    """Create a PubMedClient shared by tests that mock its searches."""
+    return PubMedClient()
+
+
 class TestPubMedClient:
     """Test cases for PubMedClient class."""
 
@@ -16,7 +24,7 @@ class TestPubMedClient:
         client = PubMedClient()
         assert client.email == "user@example.com"  # Default email
         assert client.api_key is None
-        assert client.rate_limit_delay == 0.34
+        assert client.rate_limit_delay == 0.37
 
         # With credentials
         client = PubMedClient(email="test@example.com", api_key="test_key")
@@ -24,39 +32,47 @@ class TestPubMedClient:
         assert client.api_key == "test_key"
         assert client.rate_limit_delay == 0.1
 
-    @patch("pubmed_client.Entrez.esearch")
-    @patch("pubmed_client.Entrez.read")
-    def test_search_gene_publications_success(self, mock_read, mock_esearch):
+    def test_search_gene_publications_success(self, entrez):
         """Test successful gene publication search."""
         # Mock Bio.Entrez response
-        mock_handle = MagicMock()
-        mock_esearch.return_value = mock_handle
-        mock_read.return_value = {"Count": "1234"}
+        mock_handle = Mock(spec=["close"])
+        entrez.esearch.return_value = mock_handle
+        entrez.read.return_value = {"Count": "1234"}
 
         client = PubMedClient()
         count = client.search_gene_publications("TP53")
 
         assert count == 1234
-        assert mock_esearch.called
-        assert mock_read.called
+        assert entrez.esearch.called
+        assert entrez.read.called
         mock_handle.close.assert_called_once()
 
-    @patch("pubmed_client.Entrez.esearch")
-    @patch("pubmed_client.Entrez.read")
-    def test_search_gene_publications_with_year(self, mock_read, mock_esearch):
+    def test_search_gene_publications_with_year(self, entrez):
         """Test gene publication search with specific year."""
-        mock_handle = MagicMock()
-        mock_esearch.return_value = mock_handle
-        mock_read.return_value = {"Count": "567"}
+        mock_handle = Mock(spec=["close"])
+        entrez.esearch.return_value = mock_handle
+        entrez.read.return_value = {"Count": "567"}
 
         client = PubMedClient()
         count = client.search_gene_publications("BRCA1", year=2020)
 
         assert count == 567
         # Check that esearch was called with year in query
-        call_args = mock_esearch.call_args
+        call_args = entrez.esearch.call_args
         assert "2020[PDAT]" in call_args[1]["term"]
 
+    def test_search_passes_credentials_per_call(self, entrez):
+        """Test that credentials go with each request rather than Entrez globals."""
+        entrez.esearch.return_value = Mock(spec=["close"])
+        entrez.read.return_value = {"Count": "1"}
+
+        client = PubMedClient(email="test@example.com", api_key="test_key")
+        client.search_gene_publications("TP53")
+
+        call_kwargs = entrez.esearch.call_args[1]
+        assert call_kwargs["email"] == "test@example.com"
+        assert call_kwargs["api_key"] == "test_key"
+
     @patch("pubmed_client.Entrez.esearch")
     def test_search_gene_publications_error(self, mock_esearch):
         """Test handling of API errors."""
@@ -67,29 +83,79 @@ class TestPubMedClient:
 
         assert count == 0
 
-    @patch("pubmed_client.Entrez.esearch")
-    @patch("pubmed_client.Entrez.read")
-    def test_validate_gene_exists(self, mock_read, mock_esearch):
+    def test_validate_gene_exists(self, entrez):
         """Test gene validation."""
         # Mock response with results
-        mock_handle = MagicMock()
-        mock_esearch.return_value = mock_handle
-        mock_read.return_value = {"Count": "100"}
+        mock_handle = Mock(spec=["close"])
+        entrez.esearch.return_value = mock_handle
+        entrez.read.return_value = {"Count": "100"}
 
         client = PubMedClient()
         assert client.validate_gene_exists("TP53") is True
 
         # Mock response with no results
-        mock_read.return_value = {"Count": "0"}
+        entrez.read.return_value = {"Count": "0"}
         assert client.validate_gene_exists("NOTGENE") is False
 
+    def test_validate_gene_exists_remembers_valid_genes(self, entrez):
+        """Test that a gene that validated once is not searched again."""
+        entrez.esearch.return_value = Mock(spec=["close"])
+        entrez.read.return_value = {"Count": "100"}
+
+        client = PubMedClient()
+        assert client.validate_gene_exists("TP53") is True
+        assert client.validate_gene_exists("TP53") is True
+        assert entrez.esearch.call_count == 1
+
+    def test_clear_validated_genes(self, entrez):
+        """Test that cleared genes are searched again on the next validation."""
+        entrez.esearch.return_value = Mock(spec=["close"])
+        entrez.read.return_value = {"Count": "100"}
+
+        client = PubMedClient()
+        client.validate_gene_exists("TP53")
+        client.clear_validated_genes()
+        client.validate_gene_exists("TP53")
+        assert entrez.esearch.call_count == 2
+
+    @patch("pubmed_client.time.monotonic", return_value=100.0)
+    @patch("pubmed_client.time.sleep")
+    def test_rate_limit_spacing(self, mock_sleep, mock_monotonic):
+        """Test that back-to-back requests are spaced by the rate limit delay."""
+        client = PubMedClient()
+        for _ in range(3):
+            client._wait_for_rate_limit()
+
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        assert delays == pytest.approx([0, 0.37, 0.74])
+
+    def test_concurrent_requests_are_spaced(self, entrez):
+        """Test that requests from concurrent workers start a full delay apart."""
+        timestamps = []
+
+        def record_request(**kwargs):
+            timestamps.append(time.monotonic())
+            return Mock(spec=["close"])
+
+        entrez.esearch.side_effect = record_request
+        entrez.read.return_value = {"Count": "1"}
+
+        client = PubMedClient()
+        start = time.monotonic()
+        client.get_yearly_counts("TP53", 2020, 2023)
+
+        # The n-th request may not start before n delays have passed
+        assert len(timestamps) == 4
+        for n, stamp in enumerate(sorted(timestamps)):
+            assert stamp - start >= n * client.rate_limit_delay
+
     @patch.object(PubMedClient, "search_gene_publications")
-    def test_get_yearly_counts(self, mock_search):
+    def test_get_yearly_counts(self, mock_search, client):
         """Test fetching yearly counts."""
-        # Mock search results
-        mock_search.side_effect = [10, 20, 30]
+        # Mock search results (keyed by year since years are fetched concurrently)
+        counts = {2020: 10, 2021: 20, 2022: 30}
+        mock_search.side_effect = lambda gene, year: counts[year]
 
-        client = PubMedClient()
         yearly_counts = client.get_yearly_counts("TEST", 2020, 2022)
 
         assert len(yearly_counts) == 3
@@ -99,10 +165,11 @@ class TestPubMedClient:
         assert mock_search.call_count == 3
 
     @patch.object(PubMedClient, "search_gene_publications")
-    def test_get_yearly_counts_with_progress_callback(self, mock_search):
+    def test_get_yearly_counts_with_progress_callback(self, mock_search, client):
         """Test fetching yearly counts with progress callback."""
-        # Mock search results
-        mock_search.side_effect = [10, 20, 30]
+        # Mock search results (keyed by year since years are fetched concurrently)
+        counts = {2020: 10, 2021: 20, 2022: 30}
+        mock_search.side_effect = lambda gene, year: counts[year]
 
         # Track progress callback calls
         progress_calls = []
@@ -110,7 +177,6 @@ class TestPubMedClient:
         def progress_callback(year, count, completed, total):
             progress_calls.append((year, count, completed, total))
 
-        client = PubMedClient()
         yearly_counts = client.get_yearly_counts(
             "TEST", 2020, 2022, progress_callback=progress_callback
         )
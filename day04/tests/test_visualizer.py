@@ -3,24 +3,27 @@ Unit tests for Visualizer.
 """
 
 import pytest
-from visualizer import TrendVisualizer
+from visualizer import TrendVisualizer, _fit_trend
 import plotly.graph_objects as go
 
 
+SAMPLE_YEARS = tuple(range(2010, 2025))
+SAMPLE_COUNTS = tuple(int(100 * (1 + i * 0.1)) for i in range(len(SAMPLE_YEARS)))
+
+
+@pytest.fixture(scope="module")
+def visualizer():
+    """Create a TrendVisualizer instance shared by the module."""
+    return TrendVisualizer()
+
+
 class TestTrendVisualizer:
     """Test cases for TrendVisualizer class."""
 
-    @pytest.fixture
-    def visualizer(self):
-        """Create a TrendVisualizer instance."""
-        return TrendVisualizer()
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_data(self):
         """Provide sample data for testing."""
-        years = list(range(2010, 2025))
-        counts = [100 * (1 + i * 0.1) for i in range(len(years))]
-        return years, [int(c) for c in counts]
+        return SAMPLE_YEARS, SAMPLE_COUNTS
 
     def test_visualizer_initialization(self, visualizer):
         """Test visualizer initialization."""
@@ -38,6 +41,23 @@ class TestTrendVisualizer:
         assert fig.data[0].type == "bar"
         assert fig.data[1].type == "scatter"
 
+    def test_trend_fit_is_memoized(self, sample_data):
+        """Test that the trend fit is reused and protected from mutation."""
+        years, counts = sample_data
+        trend = _fit_trend(years, counts)
+
+        assert _fit_trend(years, counts) is trend
+        assert len(trend) == len(years)
+        assert not trend.flags.writeable
+
+    def test_timeline_chart_uses_webgl_for_long_series(self, visualizer):
+        """Test that the trend line switches to WebGL for long series."""
+        years = list(range(1000, 2025))
+        counts = [year % 7 for year in years]
+        fig = visualizer.create_timeline_chart(years, counts, "TP53")
+
+        assert fig.data[1].type == "scattergl"
+
     def test_create_recent_comparison_chart(self, visualizer):
         """Test creating comparison chart."""
         fig = visualizer.create_recent_comparison_chart(1000, 800)
@@ -91,6 +111,20 @@ class TestTrendVisualizer:
         assert fig.data[0].y[0] == previous
         assert fig.data[0].y[1] == recent
 
+    def test_create_multi_gene_comparison(self, visualizer, sample_data):
+        """Test creating the multi-gene comparison chart."""
+        years, counts = sample_data
+        gene_data = {
+            "TP53": {"years": years, "counts": counts},
+            "BRCA1": {"years": years[5:], "counts": counts[5:]},
+        }
+        fig = visualizer.create_multi_gene_comparison(gene_data)
+
+        assert isinstance(fig, go.Figure)
+        assert [trace.name for trace in fig.data] == ["TP53", "BRCA1"]
+        assert all(trace.type == "scatter" for trace in fig.data)
+        assert fig.layout.xaxis.tick0 == min(years)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -7,26 +7,125 @@ keeping the UI layer separate from business logic.
 
 import streamlit as st
 import pandas as pd
-from typing import Dict, List, Optional, Callable
-from ui_config import UIConfig
+import plotly.graph_objects as go
+from functools import cached_property
+from typing import Dict, List, Optional, Callable, Tuple
+from ui_config import CONFIG
 from visualizer import TrendVisualizer
 
 
+@st.cache_data(max_entries=256)
+def _format_interpretation(
+    trend_status: str, total: int, trend: float, peak_year: int, peak_count: int
+) -> str:
+    """Format the interpretation text, cached across reruns."""
+    params = {
+        "total": total,
+        "trend": trend,
+        "peak_year": peak_year,
+        "peak_count": peak_count,
+    }
+
+    formatter = CONFIG.INTERPRETATION_FORMATTERS.get(
+        trend_status, CONFIG.INTERPRETATION_DECLINING.format
+    )
+    return formatter(**params)
+
+
+@st.cache_data(max_entries=64)
+def _build_comparison_df(entries: Tuple[tuple, ...]) -> pd.DataFrame:
+    """
+    Build the comparison summary table, cached across reruns.
+
+    Args:
+        entries: (gene, total, average, peak_year, trend_change, status) per gene
+
+    Returns:
+        DataFrame with formatted columns for display
+    """
+    # Build the table column-wise rather than as one dict per row
+    genes, totals, averages, peaks, trends, statuses = (
+        zip(*entries) if entries else ((),) * 6
+    )
+
+    return pd.DataFrame(
+        {
+            CONFIG.TABLE_COL_GENE: genes,
+            CONFIG.TABLE_COL_TOTAL: [f"{total:,}" for total in totals],
+            CONFIG.TABLE_COL_AVERAGE: [f"{average:.0f}" for average in averages],
+            CONFIG.TABLE_COL_PEAK: peaks,
+            CONFIG.TABLE_COL_TREND: [f"{trend:+.1f}%" for trend in trends],
+            CONFIG.TABLE_COL_STATUS: statuses,
+        }
+    )
+
+
+# Figure builders cached across reruns. The leading underscore on
+# ``_visualizer`` tells st.cache_data not to hash it; the cache key is the
+# (tuple) chart data alone.
+@st.cache_data(max_entries=64)
+def _timeline_chart(
+    _visualizer: TrendVisualizer,
+    years: Tuple[int, ...],
+    counts: Tuple[int, ...],
+    gene: str,
+) -> go.Figure:
+    return _visualizer.create_timeline_chart(years, counts, gene)
+
+
+@st.cache_data(max_entries=64)
+def _multi_gene_chart(
+    _visualizer: TrendVisualizer,
+    comparison_data: Tuple[Tuple[str, Tuple[int, ...], Tuple[int, ...]], ...],
+) -> go.Figure:
+    gene_data = {
+        gene: {"years": years, "counts": counts}
+        for gene, years, counts in comparison_data
+    }
+    return _visualizer.create_multi_gene_comparison(gene_data)
+
+
+@st.cache_data(max_entries=64)
+def _growth_indicator(
+    _visualizer: TrendVisualizer, trend_change_percent: float
+) -> go.Figure:
+    return _visualizer.create_growth_indicator(trend_change_percent)
+
+
+@st.cache_data(max_entries=64)
+def _yearly_growth_chart(
+    _visualizer: TrendVisualizer, years: Tuple[int, ...], counts: Tuple[int, ...]
+) -> go.Figure:
+    return _visualizer.create_yearly_growth_chart(years, counts)
+
+
+@st.cache_data(max_entries=64)
+def _recent_comparison_chart(
+    _visualizer: TrendVisualizer, recent_5: int, previous_5: int
+) -> go.Figure:
+    return _visualizer.create_recent_comparison_chart(recent_5, previous_5)
+
+
 class UIComponents:
     """Handles all UI rendering for the application."""
 
     def __init__(self):
         """Initialize UI components."""
-        self.config = UIConfig()
-        self.visualizer = TrendVisualizer()
+        self.config = CONFIG
+
+    @cached_property
+    def visualizer(self) -> TrendVisualizer:
+        """Chart builder, created on first chart render."""
+        return TrendVisualizer()
 
     def setup_page_config(self):
         """Configure the Streamlit page."""
+        cfg = self.config
         st.set_page_config(
-            page_title=self.config.PAGE_TITLE,
-            page_icon=self.config.PAGE_ICON,
-            layout=self.config.LAYOUT,
-            initial_sidebar_state=self.config.INITIAL_SIDEBAR_STATE,
+            page_title=cfg.PAGE_TITLE,
+            page_icon=cfg.PAGE_ICON,
+            layout=cfg.LAYOUT,
+            initial_sidebar_state=cfg.INITIAL_SIDEBAR_STATE,
         )
 
     def apply_custom_css(self):
@@ -35,14 +134,7 @@ class UIComponents:
 
     def render_header(self):
         """Render the main header."""
-        st.markdown(
-            f'<div class="main-header">{self.config.MAIN_HEADER}</div>',
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            f'<div class="sub-header">{self.config.SUB_HEADER}</div>',
-            unsafe_allow_html=True,
-        )
+        st.markdown(self.config.HEADER_HTML, unsafe_allow_html=True)
 
     def render_sidebar(
         self,
@@ -60,42 +152,79 @@ class UIComponents:
             Tuple of (use_cache, cache_days)
         """
         with st.sidebar:
-            # About section
-            st.header(self.config.SIDEBAR_ABOUT_TITLE)
-            st.write(self.config.SIDEBAR_ABOUT_TEXT)
-
-            # How to use section
-            st.header(self.config.SIDEBAR_HOW_TO_TITLE)
-            st.write(self.config.SIDEBAR_HOW_TO_TEXT)
-
-            # Example items
-            st.header(self.config.SIDEBAR_EXAMPLES_TITLE)
-            for gene in self.config.EXAMPLE_GENES:
-                if st.button(gene, key=f"example_{gene}", width="stretch"):
-                    on_example_click(gene)
-
-            st.divider()
-
-            # Settings
-            st.header(self.config.SIDEBAR_SETTINGS_TITLE)
-            use_cache = st.checkbox(
-                self.config.SETTING_USE_CACHE_LABEL,
-                value=True,
-                help=self.config.SETTING_USE_CACHE_HELP,
-            )
-            cache_days = st.slider(
-                self.config.SETTING_CACHE_AGE_LABEL,
-                1,
-                90,
-                30,
-                help=self.config.SETTING_CACHE_AGE_HELP,
-            )
+            self._render_sidebar_fragment(on_example_click, on_clear_cache)
+
+        # Settings widgets are keyed, so their latest values live in
+        # session state even when only the fragment reran
+        return st.session_state.use_cache, st.session_state.cache_days
+
+    @st.fragment
+    def _render_sidebar_fragment(
+        self,
+        on_example_click: Callable[[str], None],
+        on_clear_cache: Callable[[], None],
+    ):
+        """
+        Render the sidebar body as a fragment.
+
+        Toggling a setting reruns only this fragment instead of the whole
+        results pipeline.
+
+        Args:
+            on_example_click: Callback when example item is clicked
+            on_clear_cache: Callback when clear cache is clicked
+        """
+        cfg = self.config
+
+        # About section
+        st.header(cfg.SIDEBAR_ABOUT_TITLE)
+        st.write(cfg.SIDEBAR_ABOUT_TEXT)
+
+        # How to use section
+        st.header(cfg.SIDEBAR_HOW_TO_TITLE)
+        st.write(cfg.SIDEBAR_HOW_TO_TEXT)
+
+        # Example items
+        st.header(cfg.SIDEBAR_EXAMPLES_TITLE)
+        picked = st.pills(
+            cfg.SIDEBAR_EXAMPLES_TITLE,
+            cfg.EXAMPLE_GENES,
+            selection_mode="single",
+            key="example_pick",
+            label_visibility="collapsed",
+        )
+        # The selection persists across reruns, so only react when it changes
+        if picked != st.session_state.get("_last_example"):
+            st.session_state["_last_example"] = picked
+            if picked:
+                on_example_click(picked)
 
-            if st.button(self.config.BUTTON_CLEAR_CACHE, width="stretch"):
-                on_clear_cache()
-                st.success(self.config.MESSAGE_CACHE_CLEARED)
+        st.divider()
+
+        # Settings
+        st.header(cfg.SIDEBAR_SETTINGS_TITLE)
+        st.checkbox(
+            cfg.SETTING_USE_CACHE_LABEL,
+            value=True,
+            key="use_cache",
+            help=cfg.SETTING_USE_CACHE_HELP,
+        )
+        st.slider(
+            cfg.SETTING_CACHE_AGE_LABEL,
+            1,
+            90,
+            30,
+            key="cache_days",
+            help=cfg.SETTING_CACHE_AGE_HELP,
+        )
 
-        return use_cache, cache_days
+        if st.button(cfg.BUTTON_CLEAR_CACHE, width="stretch"):
+            on_clear_cache()
+            # Clearing drops the displayed results, so rerun the whole app
+            st.session_state.cache_cleared = True
+            st.rerun(scope="app")
+        if st.session_state.pop("cache_cleared", False):
+            st.success(cfg.MESSAGE_CACHE_CLEARED)
 
     def render_input_section(self, current_gene: Optional[str]) -> tuple[str, bool]:
         """
@@ -107,21 +236,22 @@ class UIComponents:
         Returns:
             Tuple of (gene_input, track_button_clicked)
         """
+        cfg = self.config
         col1, col2 = st.columns([3, 1])
 
         with col1:
             gene_input = st.text_input(
-                self.config.INPUT_GENE_LABEL,
+                cfg.INPUT_GENE_LABEL,
                 value=current_gene or "",
-                placeholder=self.config.INPUT_GENE_PLACEHOLDER,
-                help=self.config.INPUT_GENE_HELP,
+                placeholder=cfg.INPUT_GENE_PLACEHOLDER,
+                help=cfg.INPUT_GENE_HELP,
             )
 
         with col2:
             st.write("")  # Spacing
             st.write("")  # Spacing
             track_button = st.button(
-                self.config.BUTTON_TRACK_GENE,
+                cfg.BUTTON_TRACK_GENE,
                 type="primary",
                 width="stretch",
                 disabled=not gene_input or gene_input.strip() == "",
@@ -146,25 +276,26 @@ class UIComponents:
         Returns:
             Updated list of selected items
         """
+        cfg = self.config
         if not gene_history:
             return []
 
-        st.subheader(self.config.SECTION_COMPARISON_TITLE)
+        st.subheader(cfg.SECTION_COMPARISON_TITLE)
         col1, col2 = st.columns([3, 1])
 
         with col1:
             available_genes = list(gene_history.keys())
             selected = st.multiselect(
-                self.config.MULTISELECT_LABEL,
+                cfg.MULTISELECT_LABEL,
                 options=available_genes,
                 default=selected_genes if selected_genes else available_genes[-1:],
-                help=self.config.MULTISELECT_HELP,
+                help=cfg.MULTISELECT_HELP,
             )
 
         with col2:
             st.write("")  # Spacing
             st.write("")  # Spacing
-            if st.button(self.config.BUTTON_CLEAR_HISTORY, width="stretch"):
+            if st.button(cfg.BUTTON_CLEAR_HISTORY, width="stretch"):
                 on_clear_history()
 
         return selected
@@ -222,30 +353,31 @@ class UIComponents:
         Args:
             stats: Statistics dictionary
         """
+        cfg = self.config
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
             st.metric(
-                label=self.config.METRIC_TOTAL_LABEL,
+                label=cfg.METRIC_TOTAL_LABEL,
                 value=f"{stats['total_publications']:,}",
             )
 
         with col2:
             st.metric(
-                label=self.config.METRIC_AVERAGE_LABEL,
+                label=cfg.METRIC_AVERAGE_LABEL,
                 value=f"{stats['average_per_year']:.0f}",
             )
 
         with col3:
             st.metric(
-                label=self.config.METRIC_PEAK_LABEL,
+                label=cfg.METRIC_PEAK_LABEL,
                 value=stats["peak_year"],
                 delta=f"{stats['peak_count']:,} pubs",
             )
 
         with col4:
             st.metric(
-                label=self.config.METRIC_RECENT_LABEL,
+                label=cfg.METRIC_RECENT_LABEL,
                 value=f"{stats['recent_5_year_count']:,}",
                 delta=f"{stats['trend_change_percent']:+.1f}%",
             )
@@ -258,11 +390,7 @@ class UIComponents:
             trend_status: Trend status string
         """
         st.markdown(self.config.SECTION_TREND_STATUS)
-        status_class = (
-            trend_status.split()[1].lower()
-            if len(trend_status.split()) > 1
-            else "stable"
-        )
+        status_class = self.config.STATUS_CLASS_MAP.get(trend_status, "stable")
         st.markdown(
             f'<div class="status-{status_class}">{trend_status}</div>',
             unsafe_allow_html=True,
@@ -271,7 +399,7 @@ class UIComponents:
     def render_timeline_chart(self, years: List[int], counts: List[int], gene: str):
         """Render the main timeline chart."""
         st.subheader(self.config.SECTION_TIMELINE)
-        fig = self.visualizer.create_timeline_chart(years, counts, gene)
+        fig = _timeline_chart(self.visualizer, tuple(years), tuple(counts), gene)
         st.plotly_chart(fig, width="stretch")
 
     def render_multi_gene_comparison(
@@ -290,41 +418,37 @@ class UIComponents:
         st.divider()
         st.subheader(self.config.SECTION_MULTI_GENE)
 
-        # Prepare comparison data
-        comparison_data = {}
+        # Collect chart series and table rows in one pass, as hashable
+        # tuples for the cached builders
+        comparison_data = []
+        entries = []
         for gene in selected_genes:
-            if gene in gene_history:
-                gene_info = gene_history[gene]
-                comparison_data[gene] = {
-                    "years": gene_info["stats"]["years"],
-                    "counts": gene_info["stats"]["counts"],
-                }
+            info = gene_history.get(gene)
+            if info is None:
+                continue
+            stats = info["stats"]
+            comparison_data.append(
+                (gene, tuple(stats["years"]), tuple(stats["counts"]))
+            )
+            entries.append(
+                (
+                    gene,
+                    stats["total_publications"],
+                    stats["average_per_year"],
+                    stats["peak_year"],
+                    stats["trend_change_percent"],
+                    info["trend_status"],
+                )
+            )
 
         if len(comparison_data) > 1:
             # Render comparison chart
-            fig = self.visualizer.create_multi_gene_comparison(comparison_data)
+            fig = _multi_gene_chart(self.visualizer, tuple(comparison_data))
             st.plotly_chart(fig, width="stretch")
 
             # Render comparison table
             st.subheader(self.config.SECTION_COMPARISON_SUMMARY)
-            table_data = []
-            for gene in selected_genes:
-                if gene in gene_history:
-                    stats = gene_history[gene]["stats"]
-                    table_data.append(
-                        {
-                            self.config.TABLE_COL_GENE: gene,
-                            self.config.TABLE_COL_TOTAL: f"{stats['total_publications']:,}",
-                            self.config.TABLE_COL_AVERAGE: f"{stats['average_per_year']:.0f}",
-                            self.config.TABLE_COL_PEAK: stats["peak_year"],
-                            self.config.TABLE_COL_TREND: f"{stats['trend_change_percent']:+.1f}%",
-                            self.config.TABLE_COL_STATUS: gene_history[gene][
-                                "trend_status"
-                            ],
-                        }
-                    )
-
-            df = pd.DataFrame(table_data)
+            df = _build_comparison_df(tuple(entries))
             st.dataframe(df, width="stretch", hide_index=True)
 
     def render_additional_charts(self, stats: Dict):
@@ -334,26 +458,29 @@ class UIComponents:
         Args:
             stats: Statistics dictionary
         """
+        cfg = self.config
         col1, col2 = st.columns(2)
 
         with col1:
-            st.subheader(self.config.SECTION_GROWTH_INDICATOR)
-            fig = self.visualizer.create_growth_indicator(stats["trend_change_percent"])
+            st.subheader(cfg.SECTION_GROWTH_INDICATOR)
+            fig = _growth_indicator(self.visualizer, stats["trend_change_percent"])
             st.plotly_chart(fig, width="stretch")
 
         with col2:
-            st.subheader(self.config.SECTION_YOY_GROWTH)
-            fig = self.visualizer.create_yearly_growth_chart(
-                stats["years"], stats["counts"]
+            st.subheader(cfg.SECTION_YOY_GROWTH)
+            fig = _yearly_growth_chart(
+                self.visualizer, tuple(stats["years"]), tuple(stats["counts"])
             )
             st.plotly_chart(fig, width="stretch")
 
         # 5-year comparison chart
         if len(stats["counts"]) >= 10:
-            st.subheader(self.config.SECTION_ACTIVITY_COMPARISON)
+            st.subheader(cfg.SECTION_ACTIVITY_COMPARISON)
             recent_5 = stats["recent_5_year_count"]
-            previous_5 = sum(stats["counts"][-10:-5])
-            fig = self.visualizer.create_recent_comparison_chart(recent_5, previous_5)
+            previous_5 = stats.get("previous_5_year_count")
+            if previous_5 is None:
+                previous_5 = sum(stats["counts"][-10:-5])
+            fig = _recent_comparison_chart(self.visualizer, recent_5, previous_5)
             st.plotly_chart(fig, width="stretch")
 
     def render_interpretation(self, stats: Dict, trend_status: str):
@@ -381,21 +508,13 @@ class UIComponents:
         Returns:
             Interpretation text
         """
-        params = {
-            "total": stats["total_publications"],
-            "trend": stats["trend_change_percent"],
-            "peak_year": stats["peak_year"],
-            "peak_count": stats["peak_count"],
-        }
-
-        if "Hot Topic" in trend_status:
-            return self.config.INTERPRETATION_HOT.format(**params)
-        elif "Growing" in trend_status:
-            return self.config.INTERPRETATION_GROWING.format(**params)
-        elif "Stable" in trend_status:
-            return self.config.INTERPRETATION_STABLE.format(**params)
-        else:
-            return self.config.INTERPRETATION_DECLINING.format(**params)
+        return _format_interpretation(
+            trend_status,
+            stats["total_publications"],
+            stats["trend_change_percent"],
+            stats["peak_year"],
+            stats["peak_count"],
+        )
 
     def render_welcome_message(self):
         """Render welcome message when no gene is selected."""
@@ -443,3 +562,9 @@ class UIComponents:
 
         # Interpretation
         self.render_interpretation(stats, trend_status)
+
+
+@st.cache_resource
+def get_ui() -> UIComponents:
+    """Return the UIComponents instance shared across reruns and sessions."""
+    return UIComponents()
@@ -2,6 +2,8 @@
 UI configuration and text content for the Gene Trend Tracker application.
 """
 
+from types import MappingProxyType
+
 
 class UIConfig:
     """UI configuration and text content."""
@@ -17,6 +19,10 @@ class UIConfig:
     SUB_HEADER = (
         "Discover if a gene is a hot topic or old news based on publication trends"
     )
+    HEADER_HTML = (
+        f'<div class="main-header">{MAIN_HEADER}</div>'
+        f'<div class="sub-header">{SUB_HEADER}</div>'
+    )
 
     # Sidebar content
     SIDEBAR_ABOUT_TITLE = "📖 About"
@@ -33,7 +39,7 @@ publication counts in PubMed over the last 20 years.
 """
 
     SIDEBAR_EXAMPLES_TITLE = "💡 Example Genes or Topics"
-    EXAMPLE_GENES = ["TP53", "BRCA1", "EGFR", "APOE", "ACE2", "MYC", "KRAS"]
+    EXAMPLE_GENES = ("TP53", "BRCA1", "EGFR", "APOE", "ACE2", "MYC", "KRAS")
 
     SIDEBAR_SETTINGS_TITLE = "⚙️ Settings"
     SETTING_USE_CACHE_LABEL = "Use cached data"
@@ -120,6 +126,16 @@ Enter a gene or topic name above to get started, or try one of the examples from
     STATUS_STABLE = "📊 Stable"
     STATUS_DECLINING = "📉 Declining"
 
+    # CSS class suffix for each trend status badge
+    STATUS_CLASS_MAP = MappingProxyType(
+        {
+            STATUS_HOT: "hot",
+            STATUS_GROWING: "growing",
+            STATUS_STABLE: "stable",
+            STATUS_DECLINING: "declining",
+        }
+    )
+
     # Interpretation templates
     INTERPRETATION_HOT = """
 🔥 **{total:,}** total publications with a **{trend:+.1f}%** increase in recent activity! 
@@ -145,6 +161,16 @@ Research interest in this topic has declined compared to previous years. Publica
 with **{peak_count:,}** papers.
 """
 
+    # Bound format method of the interpretation template for each trend status
+    INTERPRETATION_FORMATTERS = MappingProxyType(
+        {
+            STATUS_HOT: INTERPRETATION_HOT.format,
+            STATUS_GROWING: INTERPRETATION_GROWING.format,
+            STATUS_STABLE: INTERPRETATION_STABLE.format,
+            STATUS_DECLINING: INTERPRETATION_DECLINING.format,
+        }
+    )
+
     # CSS styles
     CUSTOM_CSS = """
     <style>
@@ -191,14 +217,16 @@ with **{peak_count:,}** papers.
 """
 
     # Color scheme
-    COLORS = {
-        "hot": "#FF4B4B",
-        "growing": "#FFA500",
-        "stable": "#4B8BFF",
-        "declining": "#808080",
-    }
+    COLORS = MappingProxyType(
+        {
+            "hot": "#FF4B4B",
+            "growing": "#FFA500",
+            "stable": "#4B8BFF",
+            "declining": "#808080",
+        }
+    )
 
-    MULTI_GENE_COLORS = [
+    MULTI_GENE_COLORS = (
         "#FF4B4B",  # Red
         "#4B8BFF",  # Blue
         "#4CAF50",  # Green
@@ -207,4 +235,8 @@ with **{peak_count:,}** papers.
         "#00BCD4",  # Cyan
         "#FF9800",  # Deep Orange
         "#E91E63",  # Pink
-    ]
+    )
+
+
+# Shared instance; all settings are class-level constants
+CONFIG = UIConfig()
@@ -5,15 +5,74 @@ Creates charts and visualizations for publication trends.
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 import numpy as np
+from numpy.polynomial import polynomial as P
 from ui_config import UIConfig
 
 
+@lru_cache(maxsize=128)
+def _fit_trend(years: Tuple[int, ...], counts: Tuple[int, ...]) -> np.ndarray:
+    """
+    Evaluate a quadratic least-squares trend over the given years.
+
+    Results are memoized, so the returned array is shared and read-only.
+
+    Args:
+        years: Tuple of years
+        counts: Tuple of publication counts
+
+    Returns:
+        Trend value for each year
+    """
+    coeffs = P.polyfit(years, counts, 2)  # Quadratic fit
+    trend_y = P.polyval(years, coeffs)
+    trend_y.setflags(write=False)
+    return trend_y
+
+
 class TrendVisualizer:
     """Create visualizations for gene publication trends."""
 
+    # Static layout settings, built once and applied to every figure
+    _GRID_COLOR = "rgba(200,200,200,0.3)"
+    # Line traces switch to WebGL above this many points; below it SVG
+    # renders just as fast and avoids using up the browser's WebGL contexts
+    _WEBGL_MIN_POINTS = 1000
+    _TITLE_FONT = dict(size=24, color="#1f1f1f")
+    _TIMELINE_LAYOUT = dict(
+        xaxis_title="Year",
+        yaxis_title="Number of Publications",
+        hovermode="x unified",
+        template="plotly_white",
+        showlegend=True,
+        height=500,
+        font=dict(size=12),
+        plot_bgcolor="rgba(240,240,240,0.5)",
+    )
+    _COMPARISON_LAYOUT = dict(
+        title="5-Year Activity Comparison",
+        yaxis_title="Number of Publications",
+        template="plotly_white",
+        height=300,
+        showlegend=False,
+    )
+    _GAUGE_LAYOUT = dict(height=250, margin=dict(l=20, r=20, t=50, b=20))
+    _GROWTH_LAYOUT = dict(
+        title="Year-over-Year Growth Rate",
+        xaxis_title="Year",
+        yaxis_title="Growth Rate (%)",
+        template="plotly_white",
+        height=300,
+        showlegend=False,
+    )
+    _MULTI_GENE_LAYOUT = dict(
+        title=dict(text="Multi-Gene Publication Comparison", font=_TITLE_FONT),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        **_TIMELINE_LAYOUT,
+    )
+
     def __init__(self):
         """Initialize the visualizer."""
         self.color_scheme = UIConfig.COLORS
@@ -34,9 +93,7 @@ class TrendVisualizer:
         """
         # Calculate trend line
         if len(years) > 1:
-            z = np.polyfit(years, counts, 2)  # Quadratic fit
-            p = np.poly1d(z)
-            trend_y = p(years)
+            trend_y = _fit_trend(tuple(years), tuple(counts))
         else:
             trend_y = counts
 
@@ -57,8 +114,9 @@ class TrendVisualizer:
         )
 
         # Add trend line
+        scatter = go.Scattergl if len(years) > self._WEBGL_MIN_POINTS else go.Scatter
         fig.add_trace(
-            go.Scatter(
+            scatter(
                 x=years,
                 y=trend_y,
                 name="Trend",
@@ -67,31 +125,17 @@ class TrendVisualizer:
             )
         )
 
-        # Update layout
+        # Update layout, including both axes, in a single validated update
         fig.update_layout(
-            title=dict(
-                text=f"Publication Trend for {gene}",
-                font=dict(size=24, color="#1f1f1f"),
-            ),
-            xaxis_title="Year",
-            yaxis_title="Number of Publications",
-            hovermode="x unified",
-            template="plotly_white",
-            showlegend=True,
-            height=500,
-            font=dict(size=12),
-            plot_bgcolor="rgba(240,240,240,0.5)",
+            title=dict(text=f"Publication Trend for {gene}", font=self._TITLE_FONT),
+            xaxis_tickmode="linear",
+            xaxis_tick0=min(years),
+            xaxis_dtick=2,
+            xaxis_gridcolor=self._GRID_COLOR,
+            yaxis_gridcolor=self._GRID_COLOR,
+            **self._TIMELINE_LAYOUT,
         )
 
-        fig.update_xaxes(
-            tickmode="linear",
-            tick0=min(years),
-            dtick=2,
-            gridcolor="rgba(200,200,200,0.3)",
-        )
-
-        fig.update_yaxes(gridcolor="rgba(200,200,200,0.3)")
-
         return fig
 
     def create_recent_comparison_chart(
@@ -126,13 +170,7 @@ class TrendVisualizer:
             ]
         )
 
-        fig.update_layout(
-            title="5-Year Activity Comparison",
-            yaxis_title="Number of Publications",
-            template="plotly_white",
-            height=300,
-            showlegend=False,
-        )
+        fig.update_layout(**self._COMPARISON_LAYOUT)
 
         return fig
 
@@ -189,7 +227,7 @@ class TrendVisualizer:
             )
         )
 
-        fig.update_layout(height=250, margin=dict(l=20, r=20, t=50, b=20))
+        fig.update_layout(**self._GAUGE_LAYOUT)
 
         return fig
 
@@ -209,18 +247,16 @@ class TrendVisualizer:
         if len(years) < 2:
             return go.Figure()
 
-        # Calculate year-over-year growth
-        growth_rates = []
-        growth_years = []
-
-        for i in range(1, len(counts)):
-            if counts[i - 1] > 0:
-                growth = ((counts[i] - counts[i - 1]) / counts[i - 1]) * 100
-                growth_rates.append(growth)
-                growth_years.append(years[i])
+        # Calculate year-over-year growth, skipping years after a zero count
+        counts_arr = np.asarray(counts, dtype=np.float64)
+        previous = counts_arr[:-1]
+        has_previous = previous > 0
+        previous = previous[has_previous]
+        growth_rates = (counts_arr[1:][has_previous] - previous) / previous * 100
+        growth_years = np.asarray(years[1:])[has_previous]
 
         # Color bars based on positive/negative growth
-        colors = ["#4CAF50" if g >= 0 else "#FF5252" for g in growth_rates]
+        colors = np.where(growth_rates >= 0, "#4CAF50", "#FF5252").tolist()
 
         fig = go.Figure(
             data=[
@@ -235,14 +271,7 @@ class TrendVisualizer:
             ]
         )
 
-        fig.update_layout(
-            title="Year-over-Year Growth Rate",
-            xaxis_title="Year",
-            yaxis_title="Growth Rate (%)",
-            template="plotly_white",
-            height=300,
-            showlegend=False,
-        )
+        fig.update_layout(**self._GROWTH_LAYOUT)
 
         # Add zero line
         fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
@@ -265,14 +294,19 @@ class TrendVisualizer:
         # Color palette for different genes
         colors = UIConfig.MULTI_GENE_COLORS
 
-        fig = go.Figure()
+        total_points = sum(len(data["years"]) for data in gene_data.values())
+        trace_type = "scattergl" if total_points > self._WEBGL_MIN_POINTS else "scatter"
 
+        # Traces are plain dicts so the figure is validated once, on
+        # construction, rather than trace by trace
+        traces = []
         for idx, (gene, data) in enumerate(gene_data.items()):
             color = colors[idx % len(colors)]
 
             # Add line for each gene
-            fig.add_trace(
-                go.Scatter(
+            traces.append(
+                dict(
+                    type=trace_type,
                     x=data["years"],
                     y=data["counts"],
                     name=gene,
@@ -286,25 +320,8 @@ class TrendVisualizer:
                 )
             )
 
-        fig.update_layout(
-            title=dict(
-                text="Multi-Gene Publication Comparison",
-                font=dict(size=24, color="#1f1f1f"),
-            ),
-            xaxis_title="Year",
-            yaxis_title="Number of Publications",
-            hovermode="x unified",
-            template="plotly_white",
-            showlegend=True,
-            legend=dict(
-                orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
-            ),
-            height=500,
-            font=dict(size=12),
-            plot_bgcolor="rgba(240,240,240,0.5)",
-        )
-
-        # Only update x-axis if there's data
+        # Only set x-axis ticks if there's data
+        axes = dict(yaxis_gridcolor=self._GRID_COLOR)
         if gene_data:
             all_years = [
                 year
@@ -313,18 +330,18 @@ class TrendVisualizer:
                 for year in data["years"]
             ]
             if all_years:
-                fig.update_xaxes(
-                    tickmode="linear",
-                    tick0=min(all_years),
-                    dtick=2,
-                    gridcolor="rgba(200,200,200,0.3)",
+                axes.update(
+                    xaxis_tickmode="linear",
+                    xaxis_tick0=min(all_years),
+                    xaxis_dtick=2,
+                    xaxis_gridcolor=self._GRID_COLOR,
                 )
         else:
-            fig.update_xaxes(gridcolor="rgba(200,200,200,0.3)")
-
-        fig.update_yaxes(gridcolor="rgba(200,200,200,0.3)")
+            axes["xaxis_gridcolor"] = self._GRID_COLOR
 
-        return fig
+        return go.Figure(
+            dict(data=traces, layout=dict(**self._MULTI_GENE_LAYOUT, **axes))
+        )
 
 
 def main():
@@ -1,20 +1,33 @@
 import random
-from collections import Counter
+from string import digits
 
 
 class MasterMindGame:
 
-    def __init__(self):
+    def __init__(self, secret: str | None = None):
         self.attempts = 0
-        self.num_digits = 4
-        self.secret = self._generate_secret_number()
+        if secret is None:
+            self.num_digits = 4
+            self.secret = self._generate_secret_number()
+        else:
+            self.num_digits = len(secret)
+            self.secret = secret
+
+    @property
+    def secret(self) -> str:
+        return self._secret
+
+    @secret.setter
+    def secret(self, value: str):
+        self._secret = value
+        self._secret_counts = [value.count(digit) for digit in digits]
 
     def _generate_secret_number(self) -> str:
-        digits = random.choices(range(10), k=self.num_digits)
-        return "".join(map(str, digits))
+        number = random.randrange(10**self.num_digits)
+        return f"{number:0{self.num_digits}d}"
 
     def validate_guess(self, guess: str) -> bool:
-        return len(guess) == self.num_digits and guess.isdigit()
+        return len(guess) == self.num_digits and guess.isascii() and guess.isdigit()
 
     def evaluate_guess(self, guess: str) -> tuple[int, int]:
         exact_matches = 0
@@ -23,12 +36,10 @@ class MasterMindGame:
             if secret_digit == guess_digit:
                 exact_matches += 1
 
-        secret_counter = Counter(self.secret)
-        guess_counter = Counter(guess)
-
-        total_matches = 0
-        for digit in guess_counter:
-            total_matches += min(secret_counter[digit], guess_counter[digit])
+        total_matches = sum(
+            min(secret_count, guess.count(digit))
+            for secret_count, digit in zip(self._secret_counts, digits)
+        )
 
         wrong_position_matches = total_matches - exact_matches
 
@@ -22,10 +22,9 @@ def create_feedback(exact: int, wrong_pos: int) -> str:
 
 
 def print_history(history: list[tuple[str, str]]):
-    print("-" * 30)
-    for guess, feedback in history:
-        print(f"{guess}    {feedback}")
-    print("-" * 30)
+    separator = "-" * 30
+    rows = "".join(f"{guess}    {feedback}\n" for guess, feedback in history)
+    print(f"{separator}\n{rows}{separator}")
 
 
 def print_win_message(game: MasterMindGame):
@@ -2,8 +2,7 @@ from mastermind_logic import MasterMindGame
 
 
 def test_evaluate_guess():
-    game = MasterMindGame()
-    game.secret = "1234"
+    game = MasterMindGame("1234")
 
     exact, wrong = game.evaluate_guess("1234")
     assert exact == 4 and wrong == 0, "All digits should match exactly"
@@ -19,8 +18,7 @@ def test_evaluate_guess():
 
 
 def test_duplicates():
-    game = MasterMindGame()
-    game.secret = "1122"
+    game = MasterMindGame("1122")
 
     exact, wrong = game.evaluate_guess("1111")
     assert exact == 2, "First two 1s should match exactly"
@@ -37,4 +35,5 @@ def test_validation():
     assert not game.validate_guess("123"), "Too short"
     assert not game.validate_guess("12345"), "Too long"
     assert not game.validate_guess("12a4"), "Letters not allowed"
+    assert not game.validate_guess("١٢٣٤"), "Non-ASCII digits not allowed"
     assert not game.validate_guess(""), "Empty string invalid"